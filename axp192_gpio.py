@@ -0,0 +1,10 @@
+# LED, speaker and LCD reset lines on the AXP192 GPIOs, installed on AXP192 on first use
+class GPIO:
+    def set_led(self, state):
+        self.toggle_register_bit(0x94, 0x02, state)
+    
+    def set_speaker_enable(self, state):
+        self.toggle_register_bit(0x94, 0x04, state)
+    
+    def set_lcd_reset(self, state):
+        self.toggle_register_bit(0x96, 0x02, state)
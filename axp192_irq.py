@@ -0,0 +1,302 @@
+REG_IRQ_ENABLE_1 = const(0x40)
+REG_IRQ_ENABLE_2 = const(0x41)
+REG_IRQ_ENABLE_3 = const(0x42)
+REG_IRQ_ENABLE_4 = const(0x43)
+REG_IRQ_STATUS_1 = const(0x44)
+REG_IRQ_STATUS_2 = const(0x45)
+REG_IRQ_STATUS_3 = const(0x46)
+REG_IRQ_STATUS_4 = const(0x47)
+
+# IRQ enable and status, installed on AXP192 on first use
+class IRQ:
+    @property
+    def acin_over_voltage_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 7)
+    
+    @property
+    def acin_insert_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 6)
+    
+    @property
+    def acin_remove_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 5)
+    
+    @property
+    def vbus_over_voltage_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 4)
+    
+    @property
+    def vbus_insert_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 3)
+    
+    @property
+    def vbus_remove_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 2)
+    
+    @property
+    def vbus_valid_but_lower_than_vhold_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_1, 1)
+    
+    @property
+    def battery_insert_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 7)
+    
+    @property
+    def battery_remove_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 6)
+    
+    @property
+    def battery_active_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 5)
+    
+    @property
+    def battery_quit_active_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 4)
+    
+    @property
+    def battery_charging_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 3)
+    
+    @property
+    def battery_charging_finished_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 2)
+    
+    @property
+    def battery_over_temperature_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 1)
+    
+    @property
+    def battery_under_temperature_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_2, 1)
+    
+    @property
+    def pmu_over_temperature_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 7)
+    
+    @property
+    def insufficient_charging_current_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 6)
+    
+    @property
+    def dc_to_dc1_under_voltage_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 5)
+    
+    @property
+    def dc_to_dc2_under_voltage_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 4)
+    
+    @property
+    def dc_to_dc3_under_voltage_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 3)
+    
+    @property
+    def short_time_key_press_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 1)
+    
+    @property
+    def long_time_key_press_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_3, 0)
+    
+    @property
+    def power_on_by_noe_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 7)
+    
+    @property
+    def power_off_by_noe_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 6)
+    
+    @property
+    def vbus_valid_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 5)
+    
+    @property
+    def vbus_invalid_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 4)
+    
+    @property
+    def vbus_session_ab_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 3)
+    
+    @property
+    def vbus_session_end_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 2)
+    
+    @property
+    def aps_under_voltage_irq_enable(self):
+        return self._read_bit(REG_IRQ_ENABLE_4, 0)
+    
+    @property
+    def acin_over_voltage_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 7)
+    
+    @acin_over_voltage_irq_status.setter
+    def acin_over_voltage_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 7, value)
+        
+    @property
+    def acin_insert_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 6)
+    
+    @acin_insert_irq_status.setter
+    def acin_insert_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 6, value)
+    
+    @property
+    def acin_remove_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 5)
+    
+    @acin_remove_irq_status.setter
+    def acin_remove_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 5, value)
+    
+    @property
+    def vbus_over_voltage_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 4)
+    
+    @vbus_over_voltage_irq_status.setter
+    def vbus_over_voltage_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 4, value)
+    
+    @property
+    def vbus_insert_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 3)
+    
+    @vbus_insert_irq_status.setter
+    def vbus_insert_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 3, value)
+    
+    @property
+    def vbus_remove_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 2)
+    
+    @vbus_remove_irq_status.setter
+    def vbus_remove_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 2, value)
+    
+    @property
+    def vbus_valid_but_lower_than_vhold_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_1, 1)
+    
+    @vbus_valid_but_lower_than_vhold_irq_status.setter
+    def vbus_valid_but_lower_than_vhold_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_1, 1, value)
+    
+    @property
+    def battery_insert_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 7)
+    
+    @battery_insert_irq_status.setter
+    def battery_insert_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 7, value)
+    
+    @property
+    def battery_remove_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 6)
+    
+    @battery_remove_irq_status.setter
+    def battery_remove_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 6, value)
+    
+    @property
+    def battery_active_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 5)
+    
+    @battery_active_irq_status.setter
+    def battery_active_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 5, value)
+    
+    @property
+    def battery_quit_active_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 4)
+    
+    @battery_quit_active_irq_status.setter
+    def battery_quit_active_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 4, value)
+    
+    @property
+    def charging_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 3)
+    
+    @charging_irq_status.setter
+    def charging_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 3, value)
+    
+    @property
+    def charging_finished_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 2)
+    
+    @charging_finished_irq_status.setter
+    def charging_finished_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 2, value)
+    
+    @property
+    def battery_over_temperature_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 1)
+    
+    @battery_over_temperature_irq_status.setter
+    def battery_over_temperature_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 1, value)
+    
+    @property
+    def battery_under_temperature_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_2, 0)
+    
+    @battery_under_temperature_irq_status.setter
+    def battery_under_temperature_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_2, 0, value)
+    
+    @property
+    def over_temperature_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 7)
+    
+    @over_temperature_irq_status.setter
+    def over_temperature_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 7, value)
+    
+    @property
+    def insufficient_charging_current_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 6)
+    
+    @insufficient_charging_current_irq_status.setter
+    def insufficient_charging_current_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 6, value)
+        
+    @property
+    def dc_to_dc1_under_voltage_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 5)
+    
+    @dc_to_dc1_under_voltage_irq_status.setter
+    def dc_to_dc1_under_voltage_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 5, value)
+    
+    @property
+    def dc_to_dc2_under_voltage_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 4)
+    
+    @dc_to_dc2_under_voltage_irq_status.setter
+    def dc_to_dc2_under_voltage_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 4, value)
+    
+    @property
+    def dc_to_dc3_under_voltage_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 3)
+    
+    @dc_to_dc3_under_voltage_irq_status.setter
+    def dc_to_dc3_under_voltage_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 3, value)
+    
+    @property
+    def short_time_key_press_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 1)
+    
+    @short_time_key_press_irq_status.setter
+    def short_time_key_press_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 1, value)
+    
+    @property
+    def long_time_key_press_irq_status(self):
+        return self._read_bit(REG_IRQ_STATUS_3, 0)
+    
+    @long_time_key_press_irq_status.setter
+    def long_time_key_press_irq_status(self, value):
+        self._set_bit(REG_IRQ_STATUS_3, 0, value)
@@ -0,0 +1,180 @@
+REG_OUTPUT_CONTROL_1 = const(0x10)
+REG_OUTPUT_CONTROL_2 = const(0x12)
+REG_DC_TO_DC2_OUTPUT_VOLTAGE          = const(0x23)
+REG_DC_TO_DC2_DYNAMIC_VOLTAGE_CONTROL = const(0x25)
+REG_DC_TO_DC1_OUTPUT_VOLTAGE          = const(0x26)
+REG_DC_TO_DC3_OUTPUT_VOLTAGE          = const(0x27)
+REG_LDO2_LDO3_OUTPUT_VOLTAGE          = const(0x28)
+
+# rail enables and voltages, installed on AXP192 on first use
+class Rails:
+    @property
+    def exten_enable(self):
+        return self._read_bit(REG_OUTPUT_CONTROL_1, 2)
+    
+    @exten_enable.setter
+    def exten_enable(self, value):
+        self._set_bit(REG_OUTPUT_CONTROL_1, 2, value)
+        
+    @property
+    def dc_to_dc2_enable(self):
+        return self._read_bit(REG_OUTPUT_CONTROL_1, 0)
+    
+    @dc_to_dc2_enable.setter
+    def dc_to_dc2_enable(self, value):
+        self._set_bit(REG_OUTPUT_CONTROL_1, 0, value)
+    
+    @property
+    def ldo3_enable(self):
+        return self._read_bit(REG_OUTPUT_CONTROL_2, 3)
+    
+    @ldo3_enable.setter
+    def ldo3_enable(self, value):
+        self._set_bit(REG_OUTPUT_CONTROL_2, 3, value)
+    
+    @property
+    def ldo2_enable(self):
+        return self._read_bit(REG_OUTPUT_CONTROL_2, 2)
+    
+    @ldo2_enable.setter
+    def ldo2_enable(self, value):
+        self._set_bit(REG_OUTPUT_CONTROL_2, 2, value)
+        
+    @property
+    def dc_to_dc3_enable(self):
+        return self._read_bit(REG_OUTPUT_CONTROL_2, 1)
+    
+    @dc_to_dc3_enable.setter
+    def dc_to_dc3_enable(self, value):
+        self._set_bit(REG_OUTPUT_CONTROL_2, 1, value)
+    
+    @property
+    def dc_to_dc1_enable(self):
+        return self._read_bit(REG_OUTPUT_CONTROL_2, 0)
+    
+    @dc_to_dc1_enable.setter
+    def dc_to_dc1_enable(self, value):
+        self._set_bit(REG_OUTPUT_CONTROL_2, 0, value)
+    
+    @property
+    def dc_to_dc2_voltage(self):
+        return ((self._read_8bit(REG_DC_TO_DC2_OUTPUT_VOLTAGE) & 0x3f) * 0.025) + 0.7
+    
+    @dc_to_dc2_voltage.setter
+    def dc_to_dc2_voltage(self, voltage):
+        if voltage < 0.7:
+            voltage = 0.7
+        elif voltage > 2.275:
+            voltage = 2.275
+        value = int((voltage - 0.7) // 0.025)
+        self._write_8bit(REG_DC_TO_DC2_OUTPUT_VOLTAGE, value & 0x3f)
+        
+    @property
+    def dc_to_dc2_vrc_enable(self):
+        return self._read_bit(REG_DC_TO_DC2_DYNAMIC_VOLTAGE_CONTROL, 2)
+    
+    @dc_to_dc2_vrc_enable.setter
+    def dc_to_dc2_vrc_enable(self, value):
+        self._set_bit(REG_DC_TO_DC2_DYNAMIC_VOLTAGE_CONTROL, 2, value)
+    
+    @property
+    def dc_to_dc2_vrc_slope(self):
+        return self._read_bit(REG_DC_TO_DC2_DYNAMIC_VOLTAGE_CONTROL, 0)
+    
+    @dc_to_dc2_vrc_slope.setter
+    def dc_to_dc2_vrc_slope(self, value):
+        self._set_bit(REG_DC_TO_DC2_DYNAMIC_VOLTAGE_CONTROL, 0, value)
+    
+    @property
+    def dc_to_dc1_voltage(self):
+        return ((self._read_8bit(REG_DC_TO_DC1_OUTPUT_VOLTAGE) & 0x7f) * 0.025) + 0.7
+    
+    @dc_to_dc1_voltage.setter
+    def dc_to_dc1_voltage(self, voltage):
+        if voltage < 0.7:
+            voltage = 0.7
+        elif voltage > 3.5:
+            voltage = 3.5
+        value = int((voltage - 0.7) // 0.025)
+        self._write_8bit(REG_DC_TO_DC1_OUTPUT_VOLTAGE, value & 0x7f)
+    
+    @property
+    def dc_to_dc3_voltage(self):
+        return ((self._read_8bit(REG_DC_TO_DC3_OUTPUT_VOLTAGE) & 0x7f) * 0.025) + 0.7
+    
+    @dc_to_dc3_voltage.setter
+    def dc_to_dc3_voltage(self, voltage):
+        if voltage < 0.7:
+            voltage = 0.7
+        elif voltage > 3.5:
+            voltage = 3.5
+        value = int((voltage - 0.7) // 0.025)
+        self._write_8bit(REG_DC_TO_DC3_OUTPUT_VOLTAGE, value & 0x7f)
+    
+    @property
+    def ldo2_voltage(self):
+        return (((self._read_8bit(REG_LDO2_LDO3_OUTPUT_VOLTAGE) >> 4) & 0x0f) * 0.1) + 1.8
+    
+    @ldo2_voltage.setter
+    def ldo2_voltage(self, voltage):
+        if voltage < 1.8:
+            voltage = 1.8
+        elif voltage > 3.3:
+            voltage = 3.3
+        value = (self._read_8bit(REG_LDO2_LDO3_OUTPUT_VOLTAGE) & 0x0f) | ((int((voltage - 1.8) // 0.1) << 4) & 0xf0)
+        self._write_8bit(REG_LDO2_LDO3_OUTPUT_VOLTAGE, value)
+    
+    @property
+    def ldo3_voltage(self):
+        return ((self._read_8bit(REG_LDO2_LDO3_OUTPUT_VOLTAGE) & 0x0f) * 0.1) + 1.8
+    
+    @ldo3_voltage.setter
+    def ldo3_voltage(self, voltage):
+        if voltage < 1.8:
+            voltage = 1.8
+        elif voltage > 3.3:
+            voltage = 3.3
+        value = (self._read_8bit(REG_LDO2_LDO3_OUTPUT_VOLTAGE) & 0xf0) | (int((voltage - 1.8) // 0.1) & 0x0f)
+        self._write_8bit(REG_LDO2_LDO3_OUTPUT_VOLTAGE, value)
+    
+    def set_screen_brightness(self, brightness):
+        if brightness < 1:
+            return
+        elif brightness > 12:
+            brightness = 12
+        
+        self._write_8bit(0x28, (self._read_8bit(0x28) & 0x0f) | (brightness << 4))
+    
+    def set_dc_voltage(self, number, voltage):
+        if number < 0 or number > 2:
+            return
+        
+        if number == 0:
+            addr = 0x26
+        elif number == 1:
+            addr = 0x25
+        else:
+            addr = 0x27
+        
+        self._set_dc_voltage(addr, voltage)
+        
+    def set_ldo_voltage(self, number, voltage):
+        if number < 2 or number > 3:
+            return
+        
+        self._set_ldo_voltage(number, voltage)
+        
+    def set_esp_voltage(self, voltage):
+        if voltage >= 3000 and voltage <= 3400:
+            self._set_dc_voltage(0x26, voltage)
+    
+    def set_lcd_voltage(self, voltage):
+        if (voltage >= 2500 and voltage <= 3300):
+            self._set_dc_voltage(0x27, voltage)
+    
+    def set_charging_current(self, current):
+        options = (100, 190, 280, 360, 450, 550, 630, 700, 780, 880, 960, 1000, 1080, 1160, 1240, 1320)
+        if current not in options:
+            return
+        
+        self._set_charging_current(options.index(current))
@@ -0,0 +1,24 @@
+REG_OUTPUT_CONTROL_2 = const(0x12)
+
+# sleep and power off, installed on AXP192 on first use
+class Sleep:
+    def poweroff(self):
+        self._write_8bit(0x32, self._read_8bit(0x32) | 0x80);
+    
+    def set_adc_state(self, state):
+        if state:
+            value = 0xff
+        else:
+            value = 0x00
+            
+        self._write_8bit(0x82, value)
+    
+    def prepare_to_sleep(self):
+        self.set_adc_state(False)
+        self.set_led(False)
+        self.toggle_register_bit(REG_OUTPUT_CONTROL_2, 0x02, False)
+    
+    def restore_from_light_sleep(self):
+        self.toggle_register_bit(REG_OUTPUT_CONTROL_2, 0x02, True)
+        self.set_led(True)
+        self.set_adc_state(True)
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+REG_DC_TO_DC3_OUTPUT_VOLTAGE = const(0x27)
+REG_LDO2_LDO3_OUTPUT_VOLTAGE = const(0x28)
+
+# animates a register field towards a target level without blocking the caller.
+# the register value is cached, so every step costs a single write and no read.
+class Ramp:
+    def __init__(self, pmu, addr, mask, shift, minimum, maximum, interval_ms=20):
+        self.__pmu = pmu
+        self.__addr = addr
+        self.__mask = mask
+        self.__shift = shift
+        self.__minimum = minimum
+        self.__maximum = maximum
+        self.__interval_ms = interval_ms
+        self.__wakeup = asyncio.Event()
+        self.sync()
+
+    def sync(self):
+        # reload the cached register, call after writing it through AXP192 directly
+        self.__cache = self.__pmu.read_register(self.__addr)
+        self.__level = (self.__cache & self.__mask) >> self.__shift
+        self.__origin = self.__level
+        self.__target = self.__level
+        self.__start = time.ticks_ms()
+        self.__duration = 0
+
+    @property
+    def level(self):
+        return self.__level
+
+    @property
+    def target(self):
+        return self.__target
+
+    @property
+    def is_fading(self):
+        return self.__level != self.__target
+
+    def fade(self, level, duration_ms):
+        if level < self.__minimum:
+            level = self.__minimum
+        elif level > self.__maximum:
+            level = self.__maximum
+
+        # overlapping requests coalesce, the new fade starts wherever the previous one got to
+        self.__origin = self.__level
+        self.__target = level
+        self.__start = time.ticks_ms()
+        self.__duration = duration_ms
+        self.__wakeup.set()
+
+    def step(self):
+        if self.__level == self.__target:
+            return False
+
+        elapsed = time.ticks_diff(time.ticks_ms(), self.__start)
+        if elapsed >= self.__duration:
+            level = self.__target
+        else:
+            # rounded on the magnitude, so fades down step as evenly as fades up
+            delta = self.__target - self.__origin
+            moved = (abs(delta) * elapsed + self.__duration // 2) // self.__duration
+            level = self.__origin + moved if delta > 0 else self.__origin - moved
+
+        # late steps skip the intermediate levels instead of replaying them
+        if level != self.__level:
+            self.__write(level)
+
+        return self.__level != self.__target
+
+    def __write(self, level):
+        value = (self.__cache & ~self.__mask) | ((level << self.__shift) & self.__mask)
+        try:
+            self.__pmu.write_register(self.__addr, value)
+        except OSError:
+            # bus is busy, leave the level as is and catch up on the next step
+            return
+        self.__cache = value
+        self.__level = level
+
+    async def run(self):
+        while True:
+            await self.__wakeup.wait()
+            self.__wakeup.clear()
+            while self.step():
+                await asyncio.sleep_ms(self.__interval_ms)
+
+
+# same range as AXP192.set_screen_brightness()
+class BrightnessRamp(Ramp):
+    def __init__(self, pmu, interval_ms=20):
+        super().__init__(pmu, REG_LDO2_LDO3_OUTPUT_VOLTAGE, 0xf0, 4, 1, 12, interval_ms)
+
+
+# same range as AXP192.set_lcd_voltage(), levels are 25mV steps above 700mV
+class LcdVoltageRamp(Ramp):
+    def __init__(self, pmu, interval_ms=20):
+        super().__init__(pmu, REG_DC_TO_DC3_OUTPUT_VOLTAGE, 0x7f, 0, 72, 104, interval_ms)
+
+    @property
+    def voltage(self):
+        return self.level * 25 + 700
+
+    def fade(self, voltage, duration_ms):
+        super().fade((voltage - 700) // 25, duration_ms)
@@ -0,0 +1,85 @@
+import gc
+import sys
+import time
+
+# cold start cost of boot.py + main.py on the fake bus: importing the driver, init() and the
+# first round of main.py readings, with the heap still resident after each step.
+# "lazy" is the split driver as boot.py gets it, "eager" the split driver with every feature
+# module loaded right after the import. given a directory instead, the axp192.py found there is
+# measured, e.g. the single file driver from before the split:
+#   mkdir before && git show 74f5120~1:axp192.py > before/axp192.py
+#   micropython bench_boot.py [lazy|eager|before]
+#   python bench_boot.py [lazy|eager|before]
+
+MICROPYTHON = sys.implementation.name == 'micropython'
+
+from fakebus import FakeI2C, NoSleep, install_micropython_builtins
+install_micropython_builtins()
+
+if MICROPYTHON:
+    clock = time.ticks_us
+    elapsed_us = time.ticks_diff
+
+    def resident():
+        gc.collect()
+        return gc.mem_alloc()
+else:
+    import tracemalloc
+    clock = time.perf_counter_ns
+    elapsed_us = lambda end, start: (end - start) // 1000
+
+    def resident():
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+
+
+def read_all(pmu):
+    # the readings main.py prints
+    return (pmu.get_battery_level(), pmu.get_battery_voltage(), pmu.get_battery_current(),
+            pmu.get_battery_power(), pmu.get_battery_charging_current(), pmu.get_vin_voltage(),
+            pmu.get_vin_current(), pmu.get_vbus_voltage(), pmu.get_vbus_current(),
+            pmu.get_aps_voltage(), pmu.get_temperature(), pmu.get_warning_level())
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'lazy'
+    if mode not in ('lazy', 'eager'):
+        sys.path.insert(0, mode)
+    bus = FakeI2C()
+    base = resident()
+    steps = []
+
+    start = clock()
+    import axp192
+    from axp192 import AXP192
+    if mode == 'eager':
+        axp192.load(axp192.FEATURE_IRQ, axp192.FEATURE_RAILS, axp192.FEATURE_GPIO, axp192.FEATURE_SLEEP)
+    steps.append(('import axp192', elapsed_us(clock(), start), resident() - base))
+
+    driver_time = axp192.time
+    axp192.time = NoSleep()
+    try:
+        start = clock()
+        pmu = AXP192(bus)
+        pmu.init()
+        steps.append(('init()', elapsed_us(clock(), start), resident() - base))
+    finally:
+        axp192.time = driver_time
+
+    start = clock()
+    read_all(pmu)
+    steps.append(('first reading', elapsed_us(clock(), start), resident() - base))
+
+    print('{} {}, {} {}'.format(sys.implementation.name, sys.version.split()[0], axp192.__file__, mode))
+    print('{:<16} {:>10} {:>14}'.format('step', 'us', 'resident bytes'))
+    total = 0
+    for name, spent, heap in steps:
+        total += spent
+        print('{:<16} {:>10} {:>14}'.format(name, spent, heap))
+    print('{:<16} {:>10}'.format('to first reading', total))
+
+
+if __name__ == '__main__':
+    main()
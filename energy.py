@@ -0,0 +1,153 @@
+import time
+
+REG_VIN_VOLTAGE   = const(0x56)
+REG_BATTERY_POWER = const(0x70)
+
+# each total is a (low, carry) pair of small ints, see _add()
+BATTERY  = const(0)
+VBUS     = const(2)
+VIN      = const(4)
+DURATION = const(6)
+
+# readings are kept in units of 256 raw LSB, so a doubled trapezoid over MAX_STEP_MS
+# stays below 2^29 and every sum below MicroPython's 2^30 small int limit
+FRACTION_BITS = const(8)
+ROUNDING      = const(128)
+MAX_STEP_MS   = const(2048)
+CARRY_BITS    = const(29)
+CARRY         = const(0x20000000)
+
+TOTAL = 'total'
+
+# power per raw LSB in mW, same scaling as AXP192.get_battery_power() and the
+# product of the matching get_*_voltage() and get_*_current() readings
+BATTERY_SCALE = 0.00055
+VBUS_SCALE = 0.0017 * 0.375
+VIN_SCALE = 0.0017 * 0.625
+
+# integrates battery, VBUS and VIN power over time and attributes it to named phases.
+# samples stay fixed point integers, accumulated as trapezoids in units * ms, and are
+# only scaled to mWh by report(). time between two samples goes to the innermost
+# phase active when the second sample is taken, and always to TOTAL.
+class EnergyMeter:
+    def __init__(self, pmu):
+        self.__pmu = pmu
+        self.__adc = bytearray(8)
+        self.__power = bytearray(3)
+        self.reset()
+
+    def sample(self):
+        now = time.ticks_ms()
+        adc = self.__adc
+        power = self.__power
+        self.__pmu.read_registers_into(REG_VIN_VOLTAGE, adc)
+        self.__pmu.read_registers_into(REG_BATTERY_POWER, power)
+
+        battery = ((power[0] << 16) + (power[1] << 8) + power[2] + ROUNDING) >> FRACTION_BITS
+        vin = (((adc[0] << 4) + adc[1]) * ((adc[2] << 4) + adc[3]) + ROUNDING) >> FRACTION_BITS
+        vbus = (((adc[4] << 4) + adc[5]) * ((adc[6] << 4) + adc[7]) + ROUNDING) >> FRACTION_BITS
+
+        if self.__last is not None:
+            battery_sum = self.__battery + battery
+            vbus_sum = self.__vbus + vbus
+            vin_sum = self.__vin + vin
+            elapsed = time.ticks_diff(now, self.__last)
+            # long gaps are split so no single area leaves small int range
+            while elapsed > 0:
+                step = elapsed if elapsed < MAX_STEP_MS else MAX_STEP_MS
+                _accumulate(self.__total, battery_sum * step, vbus_sum * step, vin_sum * step, step)
+                if self.__current is not None:
+                    _accumulate(self.__current, battery_sum * step, vbus_sum * step, vin_sum * step, step)
+                elapsed -= step
+
+        self.__last = now
+        self.__battery = battery
+        self.__vbus = vbus
+        self.__vin = vin
+
+    def begin(self, name):
+        if name == TOTAL:
+            raise ValueError('phase name is reserved')
+
+        # close the interval so far under the outer phase before switching
+        self.sample()
+        totals = self.__phases.get(name)
+        if totals is None:
+            totals = self.__phases[name] = [0] * 8
+        self.__stack.append(totals)
+        self.__current = totals
+
+    def end(self):
+        if not self.__stack:
+            raise ValueError('no active phase')
+
+        self.sample()
+        self.__stack.pop()
+        self.__current = self.__stack[-1] if self.__stack else None
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def reset(self):
+        self.__last = None
+        self.__battery = 0
+        self.__vbus = 0
+        self.__vin = 0
+        self.__total = [0] * 8
+        self.__phases = {}
+        self.__stack = []
+        self.__current = None
+
+    def report(self):
+        # name -> (battery mWh, vbus mWh, vin mWh, duration ms)
+        result = {TOTAL: self.__convert(self.__total)}
+        for name, totals in self.__phases.items():
+            result[name] = self.__convert(totals)
+        return result
+
+    def raw_totals(self):
+        # name -> the fixed point (low, carry) pairs behind report(), indexed by BATTERY, VBUS, VIN and DURATION
+        result = {TOTAL: list(self.__total)}
+        for name, totals in self.__phases.items():
+            result[name] = list(totals)
+        return result
+
+    def __convert(self, totals):
+        # areas are doubled trapezoids in units of 256 LSB * ms
+        scale = (1 << FRACTION_BITS) / 7200000
+        return (_value(totals, BATTERY) * BATTERY_SCALE * scale,
+                _value(totals, VBUS) * VBUS_SCALE * scale,
+                _value(totals, VIN) * VIN_SCALE * scale,
+                _value(totals, DURATION))
+
+
+def _add(totals, index, value):
+    value += totals[index]
+    if value >= CARRY:
+        totals[index + 1] += value >> CARRY_BITS
+        value &= CARRY - 1
+    totals[index] = value
+
+
+def _accumulate(totals, battery, vbus, vin, elapsed):
+    _add(totals, BATTERY, battery)
+    _add(totals, VBUS, vbus)
+    _add(totals, VIN, vin)
+    _add(totals, DURATION, elapsed)
+
+
+def _value(totals, index):
+    return (totals[index + 1] << CARRY_BITS) + totals[index]
+
+
+class _Phase:
+    def __init__(self, meter, name):
+        self.__meter = meter
+        self.__name = name
+
+    def __enter__(self):
+        self.__meter.begin(self.__name)
+        return self.__meter
+
+    def __exit__(self, *args):
+        self.__meter.end()
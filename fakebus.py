@@ -0,0 +1,61 @@
+import sys
+import time
+
+# in-memory stand-in for machine.I2C, lets the driver run on a host or on the unix port of MicroPython.
+# every device address shares one 256 byte register map, reads at an address can be scripted ahead.
+# registers listed in clear_on_write behave like interrupt status registers: writing 1 clears a bit.
+class FakeI2C:
+    def __init__(self, registers=None, clear_on_write=()):
+        if registers is None:
+            self.registers = bytearray(256)
+        else:
+            self.registers = bytearray(registers)
+        self.reads = 0
+        self.writes = 0
+        self.__clear_on_write = clear_on_write
+        self.__scripted = {}
+
+    def script(self, addr, *values):
+        # each value is returned, in order, by one read starting at addr before falling back to the register map
+        queue = self.__scripted.setdefault(addr, [])
+        for value in values:
+            queue.append(bytes(value))
+
+    def __next(self, addr, length):
+        queue = self.__scripted.get(addr)
+        if queue:
+            value = queue.pop(0)
+            self.registers[addr:addr + len(value)] = value
+        return self.registers[addr:addr + length]
+
+    def readfrom_mem(self, device, addr, length):
+        self.reads += 1
+        return bytes(self.__next(addr, length))
+
+    def readfrom_mem_into(self, device, addr, buff):
+        self.reads += 1
+        buff[:] = self.__next(addr, len(buff))
+
+    def writeto_mem(self, device, addr, values):
+        self.writes += 1
+        for i in range(len(values)):
+            if addr + i in self.__clear_on_write:
+                self.registers[addr + i] &= ~values[i]
+            else:
+                self.registers[addr + i] = values[i]
+
+
+# stands in for the time module inside axp192, so the 100ms LCD reset hold in init() is not
+# counted as driver cost. works on MicroPython too, where the time module itself is read-only
+class NoSleep:
+    def sleep_ms(self, ms):
+        pass
+
+
+def install_micropython_builtins():
+    # lets the driver run under CPython, a no-op on MicroPython
+    if sys.implementation.name == 'micropython':
+        return
+    import builtins
+    builtins.const = lambda value: value
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
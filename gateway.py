@@ -0,0 +1,260 @@
+import argparse
+import asyncio
+import json
+import os
+import resource
+import time
+from array import array
+
+import telemetry
+
+# host side (CPython) collector for telemetry.py records sent by many Core2 devices.
+# records arrive over UDP (one or more per datagram) or TCP (a plain stream of records),
+# the latest record is kept undecoded per device and decoded only when queried.
+
+BATTERY_VOLTAGE = telemetry.FIELDS.index('battery_voltage')
+BATTERY_POWER = telemetry.FIELDS.index('battery_power')
+BATTERY_LEVEL = telemetry.FIELDS.index('battery_level')
+POWER_STATUS = telemetry.FIELDS.index('power_status')
+WARNING_LEVEL = telemetry.FIELDS.index('warning_level')
+
+EXTERNAL_POWER = telemetry.POWER_STATUS_ACIN_PRESENT | telemetry.POWER_STATUS_VBUS_PRESENT
+
+# records up to this far behind the latest seq are late or duplicated datagrams,
+# a larger backwards jump means the device rebooted (or its seq wrapped)
+REORDER_WINDOW = 256
+
+
+class Device:
+    __slots__ = ('record', 'seq', 'last_seen', 'packets', 'head', 'count',
+                 'voltages', 'powers', 'voltage_sum', 'power_sum')
+
+    def __init__(self, window):
+        self.record = None
+        self.seq = -1
+        self.last_seen = 0.0
+        self.packets = 0
+        self.head = 0
+        self.count = 0
+        self.voltages = array('H', bytes(2 * window))
+        self.powers = array('H', bytes(2 * window))
+        self.voltage_sum = 0
+        self.power_sum = 0
+
+
+class Gateway:
+    def __init__(self, window=60, offline_after=30.0):
+        self.__window = window
+        self.__offline_after = offline_after
+        self.__devices = {}
+        self.__packets = 0
+        self.__rejected = 0
+
+    def feed(self, data, now=None):
+        if now is None:
+            now = time.monotonic()
+        size = telemetry.SIZE
+        end = len(data) - size + 1
+        offset = 0
+        while offset < end:
+            self.ingest(data, offset, now)
+            offset += size
+        return offset
+
+    def ingest(self, data, offset, now):
+        fields = telemetry.unpack_from(data, offset)
+        if fields[0] != telemetry.VERSION:
+            self.__rejected += 1
+            return
+
+        device = self.__devices.get(fields[1])
+        if device is None:
+            device = self.__devices[fields[1]] = Device(self.__window)
+        elif 0 <= device.seq - fields[2] <= REORDER_WINDOW:
+            # retransmitted or reordered datagram, older than the state already kept
+            return
+
+        self.__packets += 1
+        device.packets += 1
+        device.seq = fields[2]
+        device.last_seen = now
+        device.record = bytes(data[offset:offset + telemetry.SIZE])
+
+        head = device.head
+        voltage = fields[BATTERY_VOLTAGE]
+        power = fields[BATTERY_POWER]
+        device.voltage_sum += voltage - device.voltages[head]
+        device.power_sum += power - device.powers[head]
+        device.voltages[head] = voltage
+        device.powers[head] = power
+        device.head = (head + 1) % self.__window
+        if device.count < self.__window:
+            device.count += 1
+
+    def device(self, device_id, now=None):
+        device = self.__devices.get(device_id)
+        if device is None:
+            return None
+        if now is None:
+            now = time.monotonic()
+
+        state = dict(zip(telemetry.FIELDS, telemetry.unpack_from(device.record)))
+        state['device_id'] = device_id.hex()
+        state['online'] = now - device.last_seen < self.__offline_after
+        state['age'] = round(now - device.last_seen, 3)
+        state['packets'] = device.packets
+        state['battery_voltage_avg'] = device.voltage_sum // device.count
+        state['battery_power_avg'] = device.power_sum // device.count
+        return state
+
+    def low_battery(self, level, now=None):
+        if now is None:
+            now = time.monotonic()
+        devices = []
+        for device_id, device in self.__devices.items():
+            if now - device.last_seen >= self.__offline_after:
+                continue
+            fields = telemetry.unpack_from(device.record)
+            if fields[BATTERY_LEVEL] < level and not fields[POWER_STATUS] & EXTERNAL_POWER:
+                devices.append((fields[BATTERY_LEVEL], device_id.hex()))
+        devices.sort()
+        return devices
+
+    def fleet(self, now=None):
+        if now is None:
+            now = time.monotonic()
+
+        online = 0
+        on_battery = 0
+        acin = 0
+        vbus = 0
+        charging = 0
+        warning = 0
+        level_sum = 0
+        level_min = None
+        power_sum = 0
+        for device in self.__devices.values():
+            if now - device.last_seen >= self.__offline_after:
+                continue
+            fields = telemetry.unpack_from(device.record)
+            status = fields[POWER_STATUS]
+            level = fields[BATTERY_LEVEL]
+            online += 1
+            if not status & EXTERNAL_POWER:
+                on_battery += 1
+            if status & telemetry.POWER_STATUS_ACIN_PRESENT:
+                acin += 1
+            if status & telemetry.POWER_STATUS_VBUS_PRESENT:
+                vbus += 1
+            if status & telemetry.POWER_STATUS_BATTERY_CHARGING:
+                charging += 1
+            if fields[WARNING_LEVEL]:
+                warning += 1
+            level_sum += level
+            if level_min is None or level < level_min:
+                level_min = level
+            power_sum += device.power_sum // device.count
+
+        return {
+            'devices': len(self.__devices),
+            'online': online,
+            'on_battery': on_battery,
+            'on_acin': acin,
+            'on_vbus': vbus,
+            'charging': charging,
+            'warning': warning,
+            'battery_level_avg': level_sum // online if online else None,
+            'battery_level_min': level_min,
+            'battery_power_avg_total': power_sum,
+        }
+
+    def stats(self):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {
+            'devices': len(self.__devices),
+            'packets': self.__packets,
+            'rejected': self.__rejected,
+            'cpu_time': usage.ru_utime + usage.ru_stime,
+            'max_rss_kb': usage.ru_maxrss,
+        }
+
+    def query(self, line):
+        words = line.split()
+        if not words:
+            return {'error': 'empty query'}
+        if words[0] == 'fleet':
+            return self.fleet()
+        if words[0] == 'stats':
+            return self.stats()
+        if words[0] == 'device' and len(words) == 2:
+            try:
+                device = self.device(bytes.fromhex(words[1]))
+            except ValueError:
+                return {'error': 'invalid device id'}
+            return device if device is not None else {'error': 'unknown device'}
+        if words[0] == 'low' and len(words) == 2 and words[1].isdigit():
+            return {'devices': self.low_battery(int(words[1]))}
+        return {'error': 'unknown query'}
+
+    async def __serve_query(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(json.dumps(self.query(line.decode())).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host, port, query_port):
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(lambda: _DatagramProtocol(self), local_addr=(host, port))
+        server = await loop.create_server(lambda: _StreamProtocol(self), host, port)
+        query = await asyncio.start_server(self.__serve_query, host, query_port)
+        async with server, query:
+            await asyncio.gather(server.serve_forever(), query.serve_forever())
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, gateway):
+        self.__gateway = gateway
+
+    def datagram_received(self, data, addr):
+        self.__gateway.feed(data)
+
+
+class _StreamProtocol(asyncio.Protocol):
+    def __init__(self, gateway):
+        self.__gateway = gateway
+        self.__pending = b''
+
+    def data_received(self, data):
+        if self.__pending:
+            data = self.__pending + data
+        used = self.__gateway.feed(data)
+        self.__pending = data[used:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='collect telemetry from Core2 devices')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=7192, help='UDP and TCP telemetry port')
+    parser.add_argument('--query-port', type=int, default=7193, help='TCP port for line based queries')
+    parser.add_argument('--window', type=int, default=60, help='samples kept per device for rolling averages')
+    parser.add_argument('--offline-after', type=float, default=30.0, help='seconds without data before a device is offline')
+    parser.add_argument('--cpu', type=int, help='pin the gateway to this CPU core')
+    args = parser.parse_args()
+
+    if args.cpu is not None:
+        os.sched_setaffinity(0, {args.cpu})
+
+    gateway = Gateway(args.window, args.offline_after)
+    try:
+        asyncio.run(gateway.serve(args.host, args.port, args.query_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+import argparse
+import asyncio
+import json
+import os
+import resource
+import socket
+import struct
+import subprocess
+import sys
+import time
+
+import telemetry
+
+# simulated Core2 fleet for benchmarking gateway.py, every fake device sends one
+# telemetry record per interval, spread evenly over the interval.
+
+TICK = 0.01
+
+
+class FakeDevice:
+    __slots__ = ('device_id', 'seq', 'voltage', 'vbus')
+
+    def __init__(self, number):
+        self.device_id = struct.pack('>HI', 0xc022, number)
+        self.seq = 0
+        self.voltage = 4150 - (number * 7) % 900
+        self.vbus = number % 5 == 0
+
+    def pack_into(self, buff, offset):
+        self.seq += 1
+        if self.vbus:
+            self.voltage = min(self.voltage + 1, 4150)
+            status = telemetry.POWER_STATUS_VBUS_PRESENT | telemetry.POWER_STATUS_BATTERY_CHARGING
+        else:
+            self.voltage = max(self.voltage - 1, 3250)
+            status = 0
+        level = min(100, max(0, (self.voltage - 3120) // 10))
+        struct.pack_into(telemetry.FORMAT, buff, offset, telemetry.VERSION, self.device_id, self.seq,
+                         self.voltage, -120, self.voltage * 120 // 1000, level,
+                         0, 0, 5000 if self.vbus else 0, 450 if self.vbus else 0,
+                         self.voltage, 385, status, int(self.voltage < 3300))
+
+
+async def query(host, port, line):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(line.encode() + b'\n')
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    writer.close()
+    return reply
+
+
+async def run_udp(devices, host, port, interval, duration):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 22)
+    target = (host, port)
+    buff = bytearray(telemetry.SIZE)
+
+    def send(device):
+        device.pack_into(buff, 0)
+        try:
+            sock.sendto(buff, target)
+        except BlockingIOError:
+            return 0
+        return 1
+
+    try:
+        return await _pace(devices, send, interval, duration)
+    finally:
+        sock.close()
+
+
+async def run_tcp(devices, host, port, interval, duration):
+    writers = []
+    for _ in devices:
+        _, writer = await asyncio.open_connection(host, port)
+        writers.append(writer)
+    by_device = dict(zip((device.device_id for device in devices), writers))
+
+    def send(device):
+        buff = bytearray(telemetry.SIZE)
+        device.pack_into(buff, 0)
+        by_device[device.device_id].write(buff)
+        return 1
+
+    try:
+        return await _pace(devices, send, interval, duration)
+    finally:
+        for writer in writers:
+            writer.close()
+
+
+async def _pace(devices, send, interval, duration):
+    rate = len(devices) / interval
+    offered = 0
+    sent = 0
+    start = time.monotonic()
+    while True:
+        elapsed = time.monotonic() - start
+        if elapsed >= duration:
+            break
+        # a late tick sends everything that fell due since the last one
+        due = int(elapsed * rate)
+        while offered < due:
+            sent += send(devices[offered % len(devices)])
+            offered += 1
+        await asyncio.sleep(TICK)
+    return sent, time.monotonic() - start
+
+
+async def benchmark(args):
+    devices = [FakeDevice(number) for number in range(args.devices)]
+    before = await query(args.host, args.query_port, 'stats')
+    if args.transport == 'udp':
+        sent, elapsed = await run_udp(devices, args.host, args.port, args.interval, args.duration)
+    else:
+        sent, elapsed = await run_tcp(devices, args.host, args.port, args.interval, args.duration)
+    await asyncio.sleep(1.0)
+    after = await query(args.host, args.query_port, 'stats')
+    fleet = await query(args.host, args.query_port, 'fleet')
+
+    received = after['packets'] - before['packets']
+    cpu = after['cpu_time'] - before['cpu_time']
+    print('transport        : {}'.format(args.transport))
+    print('devices          : {}'.format(args.devices))
+    print('records sent     : {} ({:.0f}/s)'.format(sent, sent / elapsed))
+    print('records received : {} ({:.1f}%)'.format(received, 100.0 * received / sent if sent else 0.0))
+    print('gateway cpu      : {:.1f}% of one core'.format(100.0 * cpu / elapsed))
+    print('gateway cpu/rec  : {:.1f}us'.format(1e6 * cpu / received if received else 0.0))
+    print('gateway max rss  : {}KiB'.format(after['max_rss_kb']))
+    print('fleet            : {}'.format(json.dumps(fleet)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='simulate a fleet of Core2 devices against gateway.py')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7192)
+    parser.add_argument('--query-port', type=int, default=7193)
+    parser.add_argument('--devices', type=int, default=5000)
+    parser.add_argument('--interval', type=float, default=1.0, help='seconds between records of one device')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--transport', choices=('udp', 'tcp'), default='udp')
+    parser.add_argument('--spawn', action='store_true', help='start gateway.py pinned to CPU 0 for the run')
+    args = parser.parse_args()
+
+    # one TCP connection per device
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < args.devices + 64 <= hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (args.devices + 64, hard))
+
+    gateway = None
+    if args.spawn:
+        gateway = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gateway.py'),
+                                    '--host', args.host, '--port', str(args.port),
+                                    '--query-port', str(args.query_port), '--cpu', '0'])
+        cpus = os.sched_getaffinity(0) - {0}
+        if cpus:
+            os.sched_setaffinity(0, cpus)
+        time.sleep(1.0)
+
+    try:
+        asyncio.run(benchmark(args))
+    finally:
+        if gateway is not None:
+            gateway.terminate()
+            gateway.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import time
+
+REG_PEK_PARAMETERS = const(0x36)
+REG_IRQ_ENABLE_3   = const(0x42)
+REG_IRQ_STATUS_1   = const(0x44)
+REG_IRQ_STATUS_3   = const(0x46)
+
+IRQ_LONG_TIME_KEY_PRESS  = const(0x01)
+IRQ_SHORT_TIME_KEY_PRESS = const(0x02)
+
+# time the key must be held to power on, 0x36 bits 7-6
+POWER_ON_128MS = const(0)
+POWER_ON_512MS = const(1)
+POWER_ON_1S    = const(2)
+POWER_ON_2S    = const(3)
+
+# time the key must be held to raise the long press IRQ, 0x36 bits 5-4
+LONG_PRESS_1S     = const(0)
+LONG_PRESS_1500MS = const(1)
+LONG_PRESS_2S     = const(2)
+LONG_PRESS_2500MS = const(3)
+
+# time the key must be held to force a power off, 0x36 bits 1-0
+POWER_OFF_4S  = const(0)
+POWER_OFF_6S  = const(1)
+POWER_OFF_8S  = const(2)
+POWER_OFF_10S = const(3)
+
+CLICK        = const(1)
+DOUBLE_CLICK = const(2)
+LONG_PRESS   = const(3)
+
+# turns the AXP192 power key IRQ bits into click, double click and long press events.
+# handler(event, ticks_ms) is called from service(), which should run once per AXP192 IRQ;
+# attach() wires that up from the IRQ pin. a click is only reported once the double click
+# window has passed, next_service_ms() tells when that is.
+# the AXP192 holds its IRQ line low while any enabled status bit is set, so once attached the
+# power key owns the line: the other bits of each burst go to irq_handler(status) and are cleared.
+class PowerKey:
+    def __init__(self, pmu, handler, power_on=POWER_ON_512MS, long_press=LONG_PRESS_1S,
+                 power_off=POWER_OFF_4S, double_click_ms=400, debounce_ms=60):
+        self.__pmu = pmu
+        self.__handler = handler
+        self.__double_click_ms = double_click_ms
+        self.__debounce_ms = debounce_ms
+        self.__status = bytearray(4)
+        self.__pending = None
+        self.__last_press = None
+        self.__timer = None
+        self.__irq_handler = None
+        self.__schedule = None
+        self.__service_ref = self.__scheduled_service
+        self.__irq_ref = self.__irq
+
+        # automatic power off on over long press and 64ms PWROK delay, as set by AXP192.init()
+        pmu.write_register(REG_PEK_PARAMETERS, (power_on << 6) | (long_press << 4) | 0x08 | 0x04 | power_off)
+        pmu.toggle_register_bit(REG_IRQ_ENABLE_3, IRQ_SHORT_TIME_KEY_PRESS | IRQ_LONG_TIME_KEY_PRESS, True)
+
+    def service(self):
+        now = time.ticks_ms()
+        status = self.__status
+        self.__pmu.read_irq_status(status)
+        key = status[2] & (IRQ_SHORT_TIME_KEY_PRESS | IRQ_LONG_TIME_KEY_PRESS)
+        if key:
+            # only the key bits are cleared (write 1 to clear), the rest stay pending for their owners
+            self.__pmu.write_register(REG_IRQ_STATUS_3, key)
+
+        if key & IRQ_LONG_TIME_KEY_PRESS:
+            self.__pending = None
+            self.__last_press = now
+            self.__handler(LONG_PRESS, now)
+        elif key & IRQ_SHORT_TIME_KEY_PRESS:
+            self.__press(now)
+
+        pending = self.__pending
+        if pending is not None and time.ticks_diff(now, pending) >= self.__double_click_ms:
+            self.__pending = None
+            self.__handler(CLICK, pending)
+
+        # the whole burst is handed back so the caller can act on the other IRQ bits
+        return status
+
+    def __press(self, now):
+        last_press = self.__last_press
+        if last_press is not None and time.ticks_diff(now, last_press) < self.__debounce_ms:
+            return
+        self.__last_press = now
+
+        pending = self.__pending
+        if pending is not None and time.ticks_diff(now, pending) < self.__double_click_ms:
+            self.__pending = None
+            self.__handler(DOUBLE_CLICK, now)
+            return
+
+        if pending is not None:
+            self.__handler(CLICK, pending)
+        self.__pending = now
+
+    def next_service_ms(self):
+        if self.__pending is None:
+            return None
+        remaining = self.__double_click_ms - time.ticks_diff(time.ticks_ms(), self.__pending)
+        return remaining if remaining > 0 else 0
+
+    def attach(self, pin, timer=None, irq_handler=None):
+        # service() runs through micropython.schedule(), timer flushes a pending click
+        import micropython
+        self.__schedule = micropython.schedule
+        self.__timer = timer
+        self.__irq_handler = irq_handler
+        pin.irq(trigger=pin.IRQ_FALLING, handler=self.__irq_ref)
+
+    def __irq(self, _):
+        self.__schedule(self.__service_ref, None)
+
+    def __scheduled_service(self, _):
+        status = self.service()
+        status[2] &= ~(IRQ_SHORT_TIME_KEY_PRESS | IRQ_LONG_TIME_KEY_PRESS)
+        if any(status):
+            if self.__irq_handler is not None:
+                self.__irq_handler(status)
+            # anything left pending would keep the line low and no further falling edge would come
+            for i in range(4):
+                if status[i]:
+                    self.__pmu.write_register(REG_IRQ_STATUS_1 + i, status[i])
+
+        remaining = self.next_service_ms()
+        if remaining is not None and self.__timer is not None:
+            self.__timer.init(mode=self.__timer.ONE_SHOT, period=remaining + 1, callback=self.__irq_ref)
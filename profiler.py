@@ -0,0 +1,150 @@
+import gc
+import sys
+import time
+
+# per call heap and time cost of every public AXP192 method and property, on the fake bus.
+#   micropython profiler.py [repeat]
+#   python profiler.py [repeat]
+
+MICROPYTHON = sys.implementation.name == 'micropython'
+
+if MICROPYTHON:
+    tracemalloc = None
+    clock = time.ticks_us
+    elapsed_us = time.ticks_diff
+else:
+    import tracemalloc
+    clock = time.perf_counter_ns
+    elapsed_us = lambda end, start: (end - start) / 1000
+
+from fakebus import FakeI2C, NoSleep, install_micropython_builtins
+install_micropython_builtins()
+
+import axp192
+from axp192 import AXP192
+
+ARGS = {
+    'read_register': (0x28,),
+    'write_register': (0x28, 0xcc),
+    'read_registers_into': (0x56, bytearray(8)),
+    'read_irq_status': (bytearray(4),),
+    'set_screen_brightness': (12,),
+    'set_dc_voltage': (2, 2800),
+    'set_ldo_voltage': (2, 3300),
+    'set_esp_voltage': (3350,),
+    'set_lcd_voltage': (2800,),
+    'set_led': (True,),
+    'set_charging_current': (100,),
+    'toggle_register_bit': (0x94, 0x02, True),
+    'set_lcd_reset': (True,),
+    'set_bus_power_mode': (True,),
+    'set_speaker_enable': (False,),
+    'set_coloumb_clear': (True,),
+    'set_adc_state': (True,),
+}
+
+
+def calls(pmu):
+    for name in sorted(dir(AXP192)):
+        if name.startswith('_'):
+            continue
+        attr = getattr(AXP192, name)
+        if isinstance(attr, property):
+            yield name, (lambda name=name: getattr(pmu, name))
+            # write back what was read so the setter sees a valid value
+            value = getattr(pmu, name)
+            try:
+                setattr(pmu, name, value)
+            except AttributeError:
+                continue
+            yield name + ' =', (lambda name=name, value=value: setattr(pmu, name, value))
+        elif callable(attr):
+            method = getattr(pmu, name)
+            args = ARGS.get(name, ())
+            yield name + '()', (lambda method=method, args=args: method(*args))
+
+
+def measure_heap(call):
+    if MICROPYTHON:
+        gc.collect()
+        gc.disable()
+        before = gc.mem_alloc()
+        call()
+        allocated = gc.mem_alloc() - before
+        gc.enable()
+        return allocated
+
+    gc.collect()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    call()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def measure_time(call, repeat):
+    best = None
+    for _ in range(repeat):
+        start = clock()
+        call()
+        spent = elapsed_us(clock(), start)
+        if best is None or spent < best:
+            best = spent
+    return best
+
+
+def profile(repeat):
+    axp192.load(axp192.FEATURE_IRQ, axp192.FEATURE_RAILS, axp192.FEATURE_GPIO, axp192.FEATURE_SLEEP)
+    bus = FakeI2C()
+    pmu = AXP192(bus)
+    results = []
+    driver_time = axp192.time
+    axp192.time = NoSleep()
+    try:
+        for name, call in calls(pmu):
+            results.append(measure(bus, name, call, repeat))
+    finally:
+        axp192.time = driver_time
+
+    results.sort(key=lambda result: (result[0], result[1]), reverse=True)
+    return results
+
+
+def measure(bus, name, call, repeat):
+    try:
+        reads = bus.reads
+        writes = bus.writes
+        call()
+        reads = bus.reads - reads
+        writes = bus.writes - writes
+        spent = measure_time(call, repeat)
+        if tracemalloc is not None:
+            tracemalloc.start()
+        try:
+            allocated = measure_heap(call)
+        finally:
+            if tracemalloc is not None:
+                tracemalloc.stop()
+    except Exception as e:
+        return (-1, 0, 0, 0, name, type(e).__name__)
+    return (allocated, spent, reads, writes, name, '')
+
+
+def report(results):
+    print('{:<52} {:>8} {:>10} {:>6} {:>6}'.format('call', 'bytes', 'us', 'reads', 'writes'))
+    for allocated, spent, reads, writes, name, error in results:
+        if error:
+            print('{:<52} failed with {}'.format(name, error))
+        else:
+            print('{:<52} {:>8} {:>10.1f} {:>6} {:>6}'.format(name, allocated, spent, reads, writes))
+
+
+def main():
+    repeat = 20
+    if len(sys.argv) > 1:
+        repeat = int(sys.argv[1])
+    print('{} {}, best of {} calls'.format(sys.implementation.name, sys.version.split()[0], repeat))
+    report(profile(repeat))
+
+
+if __name__ == '__main__':
+    main()
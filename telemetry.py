@@ -0,0 +1,41 @@
+import struct
+
+try:
+    from micropython import const
+except ImportError:
+    const = lambda value: value
+
+# one fixed size record per reading, shared by the device side (MicroPython) and gateway.py (CPython).
+# values are scaled to integers so the record stays small and decoding needs no floats:
+# version, device id, sequence, battery mV, battery mA, battery mW, battery %, vin mV, vin mA,
+# vbus mV, vbus mA, aps mV, temperature in 0.1C, power status (reg 0x00), warning level
+VERSION = const(1)
+FORMAT = '>B6sIHhHBHHHHHhBB'
+SIZE = struct.calcsize(FORMAT)
+FIELDS = ('version', 'device_id', 'seq', 'battery_voltage', 'battery_current', 'battery_power', 'battery_level',
+          'vin_voltage', 'vin_current', 'vbus_voltage', 'vbus_current', 'aps_voltage', 'temperature',
+          'power_status', 'warning_level')
+
+POWER_STATUS_ACIN_PRESENT = const(0x80)
+POWER_STATUS_VBUS_PRESENT = const(0x20)
+POWER_STATUS_BATTERY_CHARGING = const(0x04)
+
+
+def pack_into(buff, offset, pmu, device_id, seq):
+    struct.pack_into(FORMAT, buff, offset, VERSION, device_id, seq,
+                     int(pmu.get_battery_voltage() * 1000),
+                     int(pmu.get_battery_current()),
+                     int(pmu.get_battery_power()),
+                     int(pmu.get_battery_level()),
+                     int(pmu.get_vin_voltage() * 1000),
+                     int(pmu.get_vin_current()),
+                     int(pmu.get_vbus_voltage() * 1000),
+                     int(pmu.get_vbus_current()),
+                     int(pmu.get_aps_voltage() * 1000),
+                     int(pmu.get_temperature() * 10),
+                     pmu.get_input_state(),
+                     pmu.get_warning_level())
+
+
+def unpack_from(buff, offset=0):
+    return struct.unpack_from(FORMAT, buff, offset)
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fakebus import FakeI2C, install_micropython_builtins
+install_micropython_builtins()
+
+import axp192
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def ticks_ms(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, 'ticks_ms', clock.ticks_ms, raising=False)
+    monkeypatch.setattr(time, 'ticks_diff', lambda end, start: end - start, raising=False)
+    return clock
+
+
+@pytest.fixture
+def bus():
+    # the IRQ status registers clear on write like on the AXP192
+    return FakeI2C(clear_on_write=range(0x44, 0x48))
+
+
+@pytest.fixture
+def pmu(bus):
+    return axp192.AXP192(bus)
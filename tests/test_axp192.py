@@ -0,0 +1,51 @@
+import sys
+
+import pytest
+
+import axp192
+
+FEATURES = (axp192.FEATURE_IRQ, axp192.FEATURE_RAILS, axp192.FEATURE_GPIO, axp192.FEATURE_SLEEP)
+NAME_TABLES = (axp192._IRQ_NAMES, axp192._RAILS_NAMES, axp192._GPIO_NAMES, axp192._SLEEP_NAMES)
+
+
+@pytest.fixture
+def lazy(monkeypatch):
+    # start from the bare core class, as right after boot
+    monkeypatch.setattr(axp192, 'AXP192', type('AXP192', (axp192.AXP192,), {}))
+    monkeypatch.setattr(axp192, '_loaded', [])
+    for module_name, _ in FEATURES:
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+
+def test_name_tables_match_mixins():
+    # a stale entry would import a whole feature module before raising AttributeError
+    for (module_name, class_name), table in zip(FEATURES, NAME_TABLES):
+        mixin = getattr(__import__(module_name), class_name)
+        names = set(name for name in vars(mixin) if not name.startswith('__'))
+        assert len(table) == len(set(table))
+        assert set(table) == names
+
+
+def test_init_and_readings_load_no_feature(lazy, bus):
+    pmu = axp192.AXP192(bus)
+    pmu.init()
+    pmu.get_battery_voltage()
+    pmu.read_irq_status(bytearray(4))
+
+    assert axp192._loaded == []
+
+
+def test_misspelled_attribute_loads_nothing(lazy, bus):
+    pmu = axp192.AXP192(bus)
+    with pytest.raises(AttributeError):
+        pmu.ldo4_voltage
+
+    assert axp192._loaded == []
+
+
+def test_setter_loads_its_feature(lazy, bus):
+    pmu = axp192.AXP192(bus)
+    pmu.ldo3_enable = True
+
+    assert bus.registers[0x12] & 0x08
+    assert axp192._loaded == [axp192.FEATURE_RAILS]
@@ -0,0 +1,92 @@
+import pytest
+
+from backlight import BrightnessRamp
+
+
+@pytest.fixture
+def ramp(pmu, clock):
+    return BrightnessRamp(pmu)
+
+
+def start_at(bus, ramp, level):
+    bus.registers[0x28] = (level << 4) | 0x0c
+    ramp.sync()
+    bus.reads = 0
+    bus.writes = 0
+
+
+def run(ramp, clock, until, step_ms=10):
+    levels = []
+    while clock.now < until:
+        clock.now += step_ms
+        ramp.step()
+        levels.append(ramp.level)
+    return levels
+
+
+def test_fade_writes_once_per_level(bus, ramp, clock):
+    start_at(bus, ramp, 3)
+    ramp.fade(12, 500)
+    run(ramp, clock, 600)
+
+    assert ramp.level == 12
+    assert bus.writes == 9
+    assert bus.reads == 0
+    assert bus.registers[0x28] == 0xcc
+
+
+def test_fade_down_mirrors_fade_up(bus, ramp, clock):
+    start_at(bus, ramp, 3)
+    ramp.fade(12, 500)
+    up = run(ramp, clock, 600)
+
+    start_at(bus, ramp, 12)
+    ramp.fade(3, 500)
+    down = run(ramp, clock, 1200)
+
+    assert down[0] == 12
+    assert [12 - level for level in down] == [level - 3 for level in up]
+    assert bus.writes == 9
+    assert bus.registers[0x28] == 0x3c
+
+
+def test_late_steps_skip_levels(bus, ramp, clock):
+    start_at(bus, ramp, 3)
+    ramp.fade(12, 500)
+    run(ramp, clock, 600, step_ms=250)
+
+    assert ramp.level == 12
+    assert bus.writes == 2
+
+
+def test_overlapping_fades_coalesce(bus, ramp, clock):
+    start_at(bus, ramp, 3)
+    ramp.fade(12, 500)
+    run(ramp, clock, 120)
+    assert ramp.level == 5
+
+    # reversing mid fade starts from the current level instead of finishing the first fade
+    ramp.fade(3, 200)
+    run(ramp, clock, 400)
+
+    assert ramp.level == 3
+    assert bus.writes == 4
+    assert bus.reads == 0
+
+
+def test_failed_write_is_retried(bus, ramp, clock):
+    start_at(bus, ramp, 3)
+    write = bus.writeto_mem
+
+    def busy(device, addr, values):
+        raise OSError(110)
+
+    bus.writeto_mem = busy
+    ramp.fade(4, 0)
+    assert ramp.step()
+    assert ramp.level == 3
+
+    bus.writeto_mem = write
+    assert not ramp.step()
+    assert ramp.level == 4
+    assert bus.registers[0x28] == 0x4c
@@ -0,0 +1,47 @@
+import pytest
+
+from energy import EnergyMeter, TOTAL
+
+SMALL_INT = 1 << 30
+
+
+@pytest.fixture
+def meter(bus, pmu):
+    # 500mW battery, 5.1V x 500mA on VIN and VBUS
+    bus.registers[0x70:0x73] = (909091).to_bytes(3, 'big')
+    bus.registers[0x56:0x5e] = bytes((0xbb, 0x07, 0x32, 0x00, 0xbb, 0x07, 0x53, 0x05))
+    return EnergyMeter(pmu)
+
+
+def test_integrates_per_phase(meter, clock):
+    meter.sample()
+    clock.now = 1800000
+    with meter.phase('wifi-tx'):
+        clock.now = 3600000
+
+    report = meter.report()
+    battery, vbus, vin, duration = report[TOTAL]
+    assert battery == pytest.approx(500.0, rel=1e-3)
+    assert vbus == pytest.approx(5.1 * 500, rel=1e-2)
+    assert vin == pytest.approx(5.1 * 500, rel=1e-2)
+    assert duration == 3600000
+    assert report['wifi-tx'][0] == pytest.approx(250.0, rel=1e-3)
+    assert report['wifi-tx'][3] == 1800000
+
+
+def test_accumulators_stay_small_ints(meter, clock):
+    meter.sample()
+    for _ in range(10000):
+        clock.now += 1000
+        meter.sample()
+
+    for phase in meter.raw_totals().values():
+        assert all(value < SMALL_INT for value in phase)
+    assert meter.report()[TOTAL][0] == pytest.approx(500.0 * 10000 / 3600, rel=1e-3)
+
+
+def test_rejects_unbalanced_and_reserved_phases(meter, clock):
+    with pytest.raises(ValueError):
+        meter.end()
+    with pytest.raises(ValueError):
+        meter.begin(TOTAL)
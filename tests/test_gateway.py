@@ -0,0 +1,56 @@
+import struct
+
+import pytest
+
+import telemetry
+from gateway import Gateway
+
+ACIN = telemetry.POWER_STATUS_ACIN_PRESENT
+VBUS = telemetry.POWER_STATUS_VBUS_PRESENT
+
+
+def record(number, level, status, seq=1, voltage=3700):
+    return struct.pack(telemetry.FORMAT, telemetry.VERSION, struct.pack('>HI', 0xc022, number), seq,
+                       voltage, -100, 400, level, 0, 0, 0, 0, 3700, 350, status, 0)
+
+
+@pytest.fixture
+def fleet_gateway():
+    gateway = Gateway()
+    gateway.feed(record(1, 10, 0) + record(2, 10, ACIN) + record(3, 10, VBUS) + record(4, 10, ACIN | VBUS), now=0.0)
+    return gateway
+
+
+def test_fleet_counts_each_device_once(fleet_gateway):
+    fleet = fleet_gateway.fleet(now=1.0)
+
+    assert fleet['online'] == 4
+    assert fleet['on_battery'] == 1
+    assert fleet['on_acin'] == 2
+    assert fleet['on_vbus'] == 2
+
+
+def test_low_battery_skips_externally_powered_devices(fleet_gateway):
+    assert fleet_gateway.low_battery(20, now=1.0) == [(10, 'c02200000001')]
+
+
+def test_late_records_do_not_overwrite_newer_state():
+    gateway = Gateway()
+    gateway.feed(record(1, 50, 0, seq=5, voltage=3600), now=0.0)
+    gateway.feed(record(1, 90, 0, seq=4, voltage=4100) + record(1, 90, 0, seq=5, voltage=4100), now=1.0)
+    state = gateway.device(bytes.fromhex('c02200000001'), now=1.0)
+
+    assert state['seq'] == 5
+    assert state['battery_level'] == 50
+    assert state['battery_voltage_avg'] == 3600
+    assert state['packets'] == 1
+
+
+def test_reboot_restarts_seq():
+    gateway = Gateway()
+    gateway.feed(record(1, 50, 0, seq=1000), now=0.0)
+    gateway.feed(record(1, 90, 0, seq=1), now=1.0)
+    state = gateway.device(bytes.fromhex('c02200000001'), now=1.0)
+
+    assert state['seq'] == 1
+    assert state['battery_level'] == 90
@@ -0,0 +1,93 @@
+import sys
+import types
+
+import pytest
+
+import pek
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def key(pmu, events):
+    return pek.PowerKey(pmu, lambda event, ticks: events.append((event, ticks)))
+
+
+def press(bus, key, clock, at, irq, status_4=0x00):
+    clock.now = at
+    bus.script(0x44, (0x20, 0x00, irq, status_4))
+    key.service()
+
+
+def test_configures_timing_and_key_irqs(bus, key):
+    assert bus.registers[0x36] == 0x4c
+    assert bus.registers[0x42] & 0x03 == 0x03
+
+
+def test_gestures(bus, key, events, clock):
+    press(bus, key, clock, 0, 0x02)
+    press(bus, key, clock, 100, 0x02)
+    press(bus, key, clock, 1000, 0x02)
+    press(bus, key, clock, 1030, 0x02)
+    press(bus, key, clock, 1500, 0x00)
+    press(bus, key, clock, 2000, 0x01)
+
+    assert events == [(pek.DOUBLE_CLICK, 100), (pek.CLICK, 1000), (pek.LONG_PRESS, 2000)]
+
+
+def test_only_key_bits_are_cleared(bus, key, clock):
+    press(bus, key, clock, 0, 0x03 | 0x80, status_4=0x01)
+
+    # VBUS insert, over temperature and the warning level bit stay pending
+    assert bus.registers[0x44:0x48] == bytes((0x20, 0x00, 0x80, 0x01))
+
+
+class IrqPin:
+    # drives the handler on falling edges of the AXP192 IRQ line, low while any enabled status bit is set
+    IRQ_FALLING = 2
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.handler = None
+        self.low = False
+
+    def irq(self, trigger, handler):
+        self.handler = handler
+
+    def level_low(self):
+        registers = self.bus.registers
+        return any(registers[0x44 + i] & registers[0x40 + i] for i in range(4))
+
+    def update(self):
+        if self.level_low() and not self.low:
+            self.low = True
+            self.handler(self)
+        self.low = self.level_low()
+
+
+def test_attached_key_survives_other_irqs(bus, key, events, clock, monkeypatch):
+    micropython = types.ModuleType('micropython')
+    micropython.schedule = lambda callback, arg: callback(arg)
+    monkeypatch.setitem(sys.modules, 'micropython', micropython)
+
+    # VBUS insert and the APS low warning are enabled at reset
+    bus.registers[0x40] = 0x08
+    bus.registers[0x43] = 0x01
+    pin = IrqPin(bus)
+    others = []
+    key.attach(pin, irq_handler=lambda status: others.append(bytes(status)))
+
+    bus.registers[0x44] |= 0x08
+    bus.registers[0x47] |= 0x01
+    pin.update()
+    assert others == [bytes((0x08, 0x00, 0x00, 0x01))]
+    assert not pin.low
+
+    clock.now = 2000
+    bus.registers[0x46] |= 0x01
+    pin.update()
+    assert events == [(pek.LONG_PRESS, 2000)]
+    assert bus.registers[0x44:0x48] == bytes(4)